@@ -2,16 +2,50 @@ import sys
 import argparse
 import time
 import json
-from datetime import datetime
+import csv
+from contextlib import contextmanager
+from functools import lru_cache
+import numpy as np
 import serial.tools.list_ports
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTableWidget, QTableWidgetItem, QLineEdit, QPushButton, 
+                             QTableView, QAbstractItemView, QLineEdit, QPushButton, 
                              QLabel, QComboBox, QHeaderView, QStatusBar, QListWidget, QListWidgetItem, 
                              QMenu, QFileDialog, QMenuBar)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
-from PyQt6.QtGui import QFont, QColor, QPalette, QAction, QKeySequence
+from PyQt6.QtCore import (Qt, QTimer, QObject, QAbstractTableModel, 
+                          QSortFilterProxyModel, QModelIndex)
+from PyQt6.QtGui import QColor, QPalette, QAction, QKeySequence
 from canusb_backend import CANUSBBackend, CANFrame
 
+# Right-aligned decimal text for every byte value, used by the Data (Dec) column
+_DEC = tuple("%3d" % i for i in range(256))
+
+# Last formatted wall-clock second: [epoch second, "HH:MM:SS"]
+_last_sec = [-1, ""]
+
+def _format_timestamp(frame: CANFrame) -> str:
+    """Format timestamp as HH:MM:SS.mmm, running strftime once per distinct second."""
+    t = frame.timestamp
+    isec = int(t)
+    ms = int((t - isec) * 1000)
+    if isec != _last_sec[0]:
+        _last_sec[:] = [isec, time.strftime("%H:%M:%S", time.localtime(isec))]
+    return f"{_last_sec[1]}.{ms:03d}"
+
+def _format_id(frame: CANFrame) -> str:
+    return f"0x{frame.id:03X}"
+
+def _format_dlc(frame: CANFrame) -> str:
+    return str(frame.dlc)
+
+def _format_hex(frame: CANFrame) -> str:
+    return frame.data.hex(' ').upper()
+
+def _format_dec(frame: CANFrame) -> str:
+    return " ".join([_DEC[b] for b in frame.data])
+
+# Cell formatter for each table column, in header order
+_COLUMN_FORMATTERS = (_format_timestamp, _format_id, _format_dlc, _format_hex, _format_dec)
+
 class Filter:
     """Represents a filtering rule for CAN frames."""
     def __init__(self, ftype, value, logic):
@@ -19,25 +53,221 @@ class Filter:
         self.value = value.lower()
         self.logic = logic    # "Include" or "Exclude"
 
-    def matches(self, id_text, data_text):
-        """Check if the given ID and Data strings match the filter pattern."""
-        target = id_text.lower() if self.ftype == "ID" else data_text.lower()
-        match = self.value in target
-        if self.logic == "Include":
-            return match
-        else: # Exclude
-            return not match
-
     def __str__(self):
         return f"{self.logic} {self.ftype}: {self.value}"
 
+def _row_visible(id_l, data_l, inc_id, exc_id, inc_data, exc_data) -> bool:
+    """
+    Filter predicate over the lowercase ID and Data (Hex) texts of a row.
+    A row is shown if it matches any Include filter (or there are none)
+    and matches no Exclude filter.
+    """
+    if inc_id or inc_data:
+        for v in inc_id:
+            if v in id_l:
+                break
+        else:
+            for v in inc_data:
+                if v in data_l:
+                    break
+            else:
+                return False
+    for v in exc_id:
+        if v in id_l:
+            return False
+    for v in exc_data:
+        if v in data_l:
+            return False
+    return True
+
+@lru_cache(maxsize=4096)
+def _frame_visible(can_id, data, inc_id, exc_id, inc_data, exc_data) -> bool:
+    """
+    _row_visible() evaluated on a raw frame ID and payload.
+    Memoized because CAN traffic repeats the same ID/payload pairs constantly;
+    the filter tuples are part of the key, so filter edits never hit stale entries.
+    """
+    # Lowercase text of the ID and Data (Hex) columns; filter values are already lowercase
+    id_l = f"0x{can_id:03x}"
+    data_l = data.hex(' ') if (inc_data or exc_data) else ""
+    return _row_visible(id_l, data_l, inc_id, exc_id, inc_data, exc_data)
+
+# Row layout of the frame store: one fixed-size record per frame instead of a Python object
+FRAME_DTYPE = np.dtype([
+    ('ts', 'f8'),          # Arrival timestamp (unix epoch)
+    ('id', 'u4'),          # CAN Identifier
+    ('dlc', 'u1'),         # Data Length Code
+    ('data', 'u1', (8,)),  # Payload, zero padded
+    ('ext', '?'),          # Extended (29-bit) identifier
+])
+
+def _frames_to_array(frames) -> np.ndarray:
+    """Pack a list of CANFrame objects into FRAME_DTYPE records, column by column."""
+    block = np.empty(len(frames), dtype=FRAME_DTYPE)
+    block['ts'] = [f.timestamp for f in frames]
+    block['id'] = [f.id for f in frames]
+    block['dlc'] = [f.dlc for f in frames]
+    block['ext'] = [f.is_extended for f in frames]
+    payload = b"".join([f.data[:8].ljust(8, b"\0") for f in frames])
+    block['data'] = np.frombuffer(payload, dtype=np.uint8).reshape(len(frames), 8)
+    return block
+
+class CANFrameModel(QAbstractTableModel):
+    """
+    Table model holding the received CAN frames in a preallocated numpy ring buffer.
+    Cell strings are formatted on demand in data(), so only painted rows cost anything.
+    """
+    HEADERS = ["Timestamp", "ID (Hex)", "DLC", "Data (Hex)", "Data (Dec)"]
+    MAX_ROWS = 100000
+
+    def __init__(self, max_rows=MAX_ROWS, parent=None):
+        super().__init__(parent)
+        self._rows = np.zeros(max_rows, dtype=FRAME_DTYPE)
+        self._visible = np.ones(max_rows, dtype=bool) # Per-row filter result
+        self._start = 0 # Storage index of the oldest row
+        self._n = 0     # Number of stored rows
+        # Lowercased filter substrings, split by column and logic
+        self._inc_id = ()
+        self._exc_id = ()
+        self._inc_data = ()
+        self._exc_data = ()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._n
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # Strings are built only for the cells Qt is painting and never retained
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return _COLUMN_FORMATTERS[index.column()](self.frame(index.row()))
+
+    def row_text(self, row):
+        """Format all cells of the given row."""
+        frame = self.frame(row)
+        return [fmt(frame) for fmt in _COLUMN_FORMATTERS]
+
+    def _index(self, row) -> int:
+        """Map a table row to its slot in the ring buffer."""
+        return (self._start + row) % len(self._rows)
+
+    def frame(self, row) -> CANFrame:
+        ts, can_id, dlc, data, is_ext = self._rows[self._index(row)].item()
+        return CANFrame(id=can_id, dlc=dlc, data=data[:dlc].tobytes(), is_extended=is_ext, timestamp=ts)
+
+    def is_visible(self, row) -> bool:
+        return bool(self._visible[self._index(row)])
+
+    def visible_rows(self) -> np.ndarray:
+        """Row numbers of all frames that pass the active filters, in order."""
+        return np.flatnonzero(self._visible[self._index(np.arange(self._n))])
+
+    def _ring_write(self, array, pos, values):
+        """Write values into a ring-buffer array starting at slot pos, wrapping around the end."""
+        head = min(len(values), len(array) - pos)
+        array[pos:pos + head] = values[:head]
+        array[:len(values) - head] = values[head:]
+
+    def append_frames(self, frames):
+        """Add a batch of frames at the end, dropping the oldest ones when the buffer is full."""
+        if not frames:
+            return
+        max_rows = len(self._rows)
+        if len(frames) > max_rows:
+            frames = frames[-max_rows:]
+        count = len(frames)
+        overflow = self._n + count - max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self._start = (self._start + overflow) % max_rows
+            self._n -= overflow
+            self.endRemoveRows()
+
+        block = _frames_to_array(frames)
+        visible = np.fromiter((self._frame_visible(f) for f in frames), dtype=bool, count=count)
+
+        first = self._n
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        pos = self._index(first)
+        self._ring_write(self._rows, pos, block)
+        self._ring_write(self._visible, pos, visible)
+        self._n += count
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all frames."""
+        self.beginResetModel()
+        self._start = 0
+        self._n = 0
+        self.endResetModel()
+
+    def set_filters(self, filters):
+        """Precompile the filter substrings and recompute the visibility bitmap of every stored frame."""
+        def values(ftype, logic):
+            return tuple(f.value for f in filters if f.ftype == ftype and f.logic == logic)
+        self._inc_id = values("ID", "Include")
+        self._exc_id = values("ID", "Exclude")
+        self._inc_data = values("Data", "Include")
+        self._exc_data = values("Data", "Exclude")
+        self._refilter()
+
+    def _refilter(self):
+        """
+        Rebuild the visibility bitmap with vectorized passes over the stored columns.
+        The predicate runs once per distinct ID (or ID + payload) instead of once per row.
+        """
+        if not (self._inc_id or self._exc_id or self._inc_data or self._exc_data):
+            self._visible[:] = True
+            return
+        if self._n == 0:
+            return
+        slots = self._index(np.arange(self._n))
+        rows = self._rows[slots]
+        if self._inc_data or self._exc_data:
+            # Pack (id, dlc, data) into 16 bytes per row so np.unique can compare raw bytes
+            keys = np.empty((self._n, 2), dtype=np.uint64)
+            keys[:, 0] = rows['id'].astype(np.uint64) | (rows['dlc'].astype(np.uint64) << np.uint64(32))
+            keys[:, 1] = np.ascontiguousarray(rows['data']).view(np.uint64)[:, 0]
+            keys = keys.view('V16').ravel()
+        else:
+            keys = rows['id']
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        # `first` holds the row of one representative frame per distinct key
+        distinct = np.array([self._frame_visible(self.frame(row)) for row in first.tolist()], dtype=bool)
+        self._visible[slots] = distinct[inverse.ravel()]
+
+    def _frame_visible(self, frame: CANFrame) -> bool:
+        """Determine if a frame should be shown based on active filters."""
+        inc_id, exc_id, inc_data, exc_data = self._inc_id, self._exc_id, self._inc_data, self._exc_data
+        if not (inc_id or exc_id or inc_data or exc_data):
+            return True
+        # Leave the payload out of the cache key when no Data filter can look at it
+        data = frame.data if (inc_data or exc_data) else b""
+        return _frame_visible(frame.id, data, inc_id, exc_id, inc_data, exc_data)
+
+class CANFilterProxyModel(QSortFilterProxyModel):
+    """Proxy that hides rows according to the source model's visibility bitmap."""
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().is_visible(source_row)
+
+    def refresh(self):
+        """Re-evaluate row visibility after the source bitmap changed."""
+        self.invalidateFilter()
+
 class CANMonitor(QMainWindow):
     """
     Main GUI Window for the CANUSB Monitor for Linux.
     Features real-time data display, advanced filtering, and export capabilities.
     """
-    # Signal to pass received CAN frames from the backend thread to the main UI thread
-    frame_received_signal = pyqtSignal(CANFrame)
+    FLUSH_INTERVAL_MS = 33  # ~30 Hz table refresh
+    FLUSH_MAX_FRAMES = 2000 # Upper bound of frames moved into the table per tick
 
     def __init__(self, port=None, baudrate=2000000, can_speed=500000):
         super().__init__()
@@ -50,14 +280,17 @@ class CANMonitor(QMainWindow):
         self.setWindowTitle("CANUSB Monitor for Linux")
         self.resize(1100, 600)
         
-        # Connect signal for thread-safe UI updates
-        self.frame_received_signal.connect(self._do_add_frame)
-        
         self.init_menu()
         self.init_ui()
         self.apply_dark_theme()
         self.refresh_ports()
         
+        # Periodically move frames queued by the backend thread into the table.
+        # Runs only while a port is open, so an idle window has no timer wakeups.
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self._flush_pending)
+        
         # Pre-select port if provided via CLI
         if self.port:
             index = self.port_combo.findText(self.port)
@@ -132,9 +365,11 @@ class CANMonitor(QMainWindow):
         left_layout.addLayout(ctrl_layout)
 
         # Main Data Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Timestamp", "ID (Hex)", "DLC", "Data (Hex)", "Data (Dec)"])
+        self.model = CANFrameModel(parent=self)
+        self.proxy = CANFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         
         # Configure automatic and interactive column resizing
         header = self.table.horizontalHeader()
@@ -145,13 +380,20 @@ class CANMonitor(QMainWindow):
         self.table.setColumnWidth(3, 180) # Data (Hex)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch) # Data (Dec)
         
+        # Fixed row height avoids per-row size hint queries
+        v_header = self.table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        v_header.setDefaultSectionSize(18)
+        
         self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectItems)
+        self.table.setWordWrap(False) # Single-line cells skip multi-line text layout when painting
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.table.setStyleSheet("QTableWidget::item { color: white; padding: 1px; }")
+        # Monospaced data font is set once for the whole view, never per cell
+        self.table.setStyleSheet("QTableView { font-family: Monospace; font-size: 9pt; } QTableView::item { padding: 1px; }")
         left_layout.addWidget(self.table)
 
         # --- Right side: Filtering Sidebar ---
@@ -218,7 +460,7 @@ class CANMonitor(QMainWindow):
         self.setStyleSheet("""
             QWidget { background-color: #1e1e1e; color: #ffffff; font-size: 11px; }
             QLabel { color: #ffffff; font-weight: bold; }
-            QTableWidget { gridline-color: #444; background-color: #141414; alternate-background-color: #333; color: white; }
+            QTableView { gridline-color: #444; background-color: #141414; alternate-background-color: #333; color: white; }
             QHeaderView::section { background-color: #333; color: #ffffff; padding: 2px; border: 1px solid #444; }
             QLineEdit { background-color: #2b2b2b; color: #ffffff; border: 1px solid #444; padding: 2px; border-radius: 2px; }
             QPushButton { background-color: #3c3c3c; color: #ffffff; border: 1px solid #555; padding: 2px 8px; border-radius: 2px; }
@@ -276,29 +518,22 @@ class CANMonitor(QMainWindow):
             self.apply_filters_to_all()
 
     def apply_filters_to_all(self):
-        """Re-scan all rows in the table and apply filtering logic."""
-        for i in range(self.table.rowCount()):
-            self.apply_row_filter(i)
-
-    def apply_row_filter(self, row):
-        """Determine if a single row should be hidden based on active filters."""
-        id_text = self.table.item(row, 1).text()
-        data_hex = self.table.item(row, 3).text()
-        
-        show = True
-        include_filters = [f for f in self.filters if f.logic == "Include"]
-        exclude_filters = [f for f in self.filters if f.logic == "Exclude"]
-
-        # OR logic for multiple Include filters
-        if include_filters:
-            show = any(f.matches(id_text, data_hex) for f in include_filters)
-        
-        # AND logic for multiple Exclude filters
-        if show and exclude_filters:
-            if any(f.matches(id_text, data_hex) == False for f in exclude_filters):
-                show = False
-        
-        self.table.setRowHidden(row, not show)
+        """Re-evaluate the filters over all stored frames and refresh the view."""
+        with self._frozen_table():
+            self.model.set_filters(self.filters)
+            self.proxy.refresh()
+
+    @contextmanager
+    def _frozen_table(self):
+        """Suspend painting and sorting of the table while it is updated in bulk."""
+        sorting = self.table.isSortingEnabled()
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            self.table.setSortingEnabled(sorting)
+            self.table.setUpdatesEnabled(True)
 
     def refresh_ports(self):
         """Update the list of available serial ports."""
@@ -329,7 +564,7 @@ class CANMonitor(QMainWindow):
         speed = self.speed_combo.currentData()
         self.backend = CANUSBBackend(port, self.baudrate, speed)
         if self.backend.connect():
-            self.backend.add_callback(self.add_frame_to_table)
+            self.flush_timer.start()
             self.start_btn.setText("Close")
             self.start_btn.setStyleSheet("background-color: #e74c3c; color: white; font-weight: bold; padding: 5px 15px;")
             self.status_bar.showMessage(f"Connected to {port}")
@@ -339,65 +574,55 @@ class CANMonitor(QMainWindow):
     def stop_monitoring(self):
         """Stop data reception and clean up backend."""
         if self.backend:
+            self.flush_timer.stop()
             self.backend.disconnect()
+            # Keep whatever was received before the port closed
+            while self.backend.pending:
+                self._append_pending()
             self.backend = None
             self.start_btn.setText("Open")
             self.start_btn.setStyleSheet("background-color: #2ecc71; color: white; font-weight: bold; padding: 5px 15px;")
             self.status_bar.showMessage("Disconnected")
 
-    def add_frame_to_table(self, frame: CANFrame):
-        """Backend callback: schedules a UI update for a new CAN frame."""
-        self.frame_received_signal.emit(frame)
+    def _flush_pending(self):
+        """Timer slot: check the backend is still alive, then move queued frames into the table."""
+        if not self.backend:
+            return
+        if not self.backend.running:
+            # Reader thread stopped on its own, e.g. adapter initialisation failed
+            error = self.backend.error
+            self.stop_monitoring()
+            if error:
+                self.status_bar.showMessage(f"Failed to initialise adapter: {error}")
+            return
+        self._append_pending()
 
-    def _do_add_frame(self, frame: CANFrame):
-        """Actual UI update: adds a new row to the table (called on main thread)."""
+    def _append_pending(self):
+        """Move queued frames into the table as a single batch (main thread)."""
+        if not self.backend.pending:
+            return
         try:
+            pending = self.backend.pending
+            batch = [pending.popleft() for _ in range(min(len(pending), self.FLUSH_MAX_FRAMES))]
+
             # Smart Scroll Logic: only scroll if we were already at the bottom
             scrollbar = self.table.verticalScrollBar()
             is_at_bottom = scrollbar.value() >= (scrollbar.maximum() - 10)
 
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setRowHeight(row, 18)
-            
-            data_hex = " ".join(f"{b:02X}" for b in frame.data)
-            data_dec = " ".join(f"{b:3d}" for b in frame.data)
-            
-            # Format timestamp as HH:MM:SS.mmm
-            ts_str = datetime.fromtimestamp(frame.timestamp).strftime("%H:%M:%S.%f")[:-3]
-            
-            self.table.setItem(row, 0, QTableWidgetItem(ts_str))
-            self.table.setItem(row, 1, QTableWidgetItem(f"0x{frame.id:03X}"))
-            self.table.setItem(row, 2, QTableWidgetItem(str(frame.dlc)))
-            self.table.setItem(row, 3, QTableWidgetItem(data_hex))
-            self.table.setItem(row, 4, QTableWidgetItem(data_dec))
-            
-            # Formatting and monospaced font for data columns
-            mono_font = QFont("Monospace")
-            mono_font.setStyleHint(QFont.StyleHint.Monospace)
-            mono_font.setPointSize(9)
-
-            for col in range(5):
-                item = self.table.item(row, col)
-                if item:
-                    item.setForeground(Qt.GlobalColor.white)
-                    if col in [1, 3, 4]: # ID, Hex, Dec columns
-                        item.setFont(mono_font)
-
-            self.apply_row_filter(row)
-            
-            if is_at_bottom:
-                self.table.scrollToBottom()
+            with self._frozen_table():
+                self.model.append_frames(batch)
+                if is_at_bottom:
+                    self.table.scrollToBottom()
         except Exception:
             pass
 
     def clear_table(self):
         """Clear all entries from the data table."""
-        self.table.setRowCount(0)
+        self.model.clear()
 
     def export_data(self):
         """Export all visible rows to a text or CSV file."""
-        if self.table.rowCount() == 0:
+        if self.model.rowCount() == 0:
             self.status_bar.showMessage("Nothing to export!")
             return
             
@@ -409,28 +634,20 @@ class CANMonitor(QMainWindow):
             return
             
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # Write Header
-                headers = [self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())]
+            # Read straight from the frame store instead of going through the view
+            headers = CANFrameModel.HEADERS
+            rows = self.model.visible_rows().tolist()
+            row_data = (self.model.row_text(row) for row in rows)
+            export_count = len(rows)
+
+            with open(file_path, 'w', encoding='utf-8', newline='') as f:
                 if file_path.endswith('.csv'):
-                    f.write(",".join(headers) + "\n")
+                    writer = csv.writer(f, lineterminator="\n")
+                    writer.writerow(headers)
+                    writer.writerows(row_data)
                 else:
                     f.write("\t".join(headers) + "\n")
-                
-                # Write Visible Rows
-                export_count = 0
-                for row in range(self.table.rowCount()):
-                    if not self.table.isRowHidden(row):
-                        row_data = []
-                        for col in range(self.table.columnCount()):
-                            item = self.table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        
-                        if file_path.endswith('.csv'):
-                            f.write(",".join(row_data) + "\n")
-                        else:
-                            f.write("\t".join(row_data) + "\n")
-                        export_count += 1
+                    f.write("".join(["\t".join(r) + "\n" for r in row_data]))
                 
             self.status_bar.showMessage(f"Exported {export_count} rows to {file_path}")
         except Exception as e:
@@ -438,11 +655,11 @@ class CANMonitor(QMainWindow):
 
     def show_context_menu(self, pos):
         """Display context menu on right-click to copy cell value or add to filter."""
-        selected_items = self.table.selectedItems()
+        selected_items = self.table.selectionModel().selectedIndexes()
         if not selected_items:
             # If nothing selected, try to get item at position
-            item = self.table.itemAt(pos)
-            if not item:
+            item = self.table.indexAt(pos)
+            if not item.isValid():
                 return
             selected_items = [item]
             
@@ -464,7 +681,7 @@ class CANMonitor(QMainWindow):
             self.copy_to_clipboard(selected_items)
         elif action == add_filter_action:
             item = selected_items[0]
-            text = item.text()
+            text = item.data()
             col = item.column()
             if col == 1: # ID column
                 self.filter_type.setCurrentText("ID")
@@ -487,7 +704,7 @@ class CANMonitor(QMainWindow):
             r = item.row()
             if r not in rows:
                 rows[r] = []
-            rows[r].append(item.text())
+            rows[r].append(item.data())
             
         text = "\n".join(["\t".join(r_data) for r_data in rows.values()])
         QApplication.clipboard().setText(text)
@@ -1,9 +1,27 @@
 import serial
 import serial.tools.list_ports
+import struct
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Callable
+from functools import lru_cache
+from typing import Deque
+import numpy as np
+from canusb_parser import parse as jit_parse
+
+# Little-endian CAN identifiers as sent by the adapter
+_STD_ID = struct.Struct('<H')
+_EXT_ID = struct.Struct('<I')
+
+# Below this size the builtin sum() beats numpy's per-call overhead
+_CHECKSUM_NUMPY_MIN = 512
+
+def _checksum8(buf) -> int:
+    """8-bit additive checksum used by the adapter's packets."""
+    if len(buf) < _CHECKSUM_NUMPY_MIN:
+        return sum(buf) & 0xFF
+    return int(np.frombuffer(buf, dtype=np.uint8).sum()) & 0xFF
 
 @dataclass
 class CANFrame:
@@ -14,6 +32,41 @@ class CANFrame:
     is_extended: bool = False # True if using 29-bit identifier
     timestamp: float = 0.0    # Arrival timestamp (unix epoch)
 
+def _make_data_frame_decoder(cmd: int):
+    """
+    Generate a decoder specialized for one data-frame command byte.
+    Frame length, ID width and payload offsets are folded into the emitted
+    source as constants, so the Python parser does no per-frame arithmetic on them.
+    Returns (frame_len, decode) where decode(mv, pos, timestamp) gives a CANFrame,
+    or None if the end byte is wrong.
+    """
+    is_ext = bool(cmd & 0x20)
+    dlc = cmd & 0x0F
+    id_len = 4 if is_ext else 2
+    frame_len = dlc + id_len + 3 # 0xAA + CMD + ID + DATA[DLC] + 0x55
+    data_start = 2 + id_len
+    id_struct = "_EXT_ID" if is_ext else "_STD_ID"
+    payload = f"bytes(mv[pos + {data_start}:pos + {data_start + dlc}])" if dlc else 'b""'
+    src = (
+        "def decode(mv, pos, timestamp):\n"
+        f"    if mv[pos + {frame_len - 1}] != 0x55:\n"
+        "        return None\n"
+        f"    return CANFrame({id_struct}.unpack_from(mv, pos + 2)[0], {dlc}, {payload}, {is_ext}, timestamp)\n"
+    )
+    namespace = {"CANFrame": CANFrame, "_STD_ID": _STD_ID, "_EXT_ID": _EXT_ID}
+    exec(compile(src, f"<canusb decoder 0x{cmd:02X}>", "exec"), namespace)
+    return frame_len, namespace["decode"]
+
+@lru_cache(maxsize=None)
+def _data_frame_decoders():
+    """
+    Decoder table indexed by command byte, built on first use.
+    0x0C (Standard) or 0x0E (Extended) in the high nibble indicates a data frame;
+    every other entry is None.
+    """
+    return tuple(_make_data_frame_decoder(cmd) if (cmd >> 4) in (0x0C, 0x0E) else None
+                 for cmd in range(256))
+
 class CANUSBBackend:
     """
     Handles serial communication and protocol parsing for the CANUSB Monitor for Linux.
@@ -26,19 +79,19 @@ class CANUSBBackend:
         self.ser = None
         self.running = False
         self.read_thread = None
-        self.on_frame_received: List[Callable[[CANFrame], None]] = []
+        # Parsed frames waiting to be consumed by the UI thread.
+        # deque.append/popleft are atomic, so no extra locking is needed.
+        self.pending: Deque[CANFrame] = deque()
         self.buffer = bytearray()
-
-    def add_callback(self, callback: Callable[[CANFrame], None]):
-        """Register a callback function to be called when a new CAN frame is received."""
-        self.on_frame_received.append(callback)
+        self.error = None # Exception that stopped the reader thread, if any
 
     def connect(self):
         """Establish serial connection and start the background reading thread."""
         try:
             # Protocol uses 2 stop bits (CSTOPB in C)
-            self.ser = serial.Serial(self.port, self.baudrate, timeout=0.1, stopbits=serial.STOPBITS_TWO)
-            self._init_adapter()
+            # Short read timeout so the reader thread notices disconnect() quickly
+            self.ser = serial.Serial(self.port, self.baudrate, timeout=0.05, stopbits=serial.STOPBITS_TWO)
+            # Adapter configuration happens on the reader thread so the caller never blocks on it
             self.running = True
             self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
             self.read_thread.start()
@@ -56,7 +109,7 @@ class CANUSBBackend:
 
     def _generate_checksum(self, data: bytes) -> int:
         """Calculate the 8-bit checksum for command packets."""
-        return sum(data) & 0xFF
+        return _checksum8(data)
 
     def _init_adapter(self):
         """Send initialization command to the USB-CAN adapter to set CAN bus speed."""
@@ -75,73 +128,119 @@ class CANUSBBackend:
         self.ser.write(cmd)
 
     def _read_loop(self):
-        """Background thread loop to read bytes from the serial port."""
+        """Background thread loop: configure the adapter, then read bytes from the serial port."""
         self.buffer = bytearray()
+        try:
+            self.ser.reset_input_buffer() # Discard stale bytes received before configuration
+            self._init_adapter()
+        except (serial.SerialException, OSError) as exc:
+            # Report through `error`/`running`; the GUI notices and tears down
+            self.error = exc
+            self.running = False
+            self.ser.close()
+            return
         while self.running:
             self._read_loop_iteration()
-            if self.ser.in_waiting == 0:
-                time.sleep(0.001)
 
     def _read_loop_iteration(self):
-        """Read pending bytes and trigger buffer processing."""
-        if self.ser.in_waiting > 0:
-            data = self.ser.read(self.ser.in_waiting)
-            self.buffer.extend(data)
+        """Block until bytes arrive (or the read timeout expires) and trigger buffer processing."""
+        first = self.ser.read(1)
+        if not first:
+            return
+        self.buffer.extend(first)
+        waiting = self.ser.in_waiting # One ioctl per read
+        if waiting:
+            self.buffer.extend(self.ser.read(waiting))
         self._process_buffer()
 
     def _process_buffer(self):
         """
         Parse the byte buffer to identify CAN frames using the specified framing.
         Framing: 0xAA (Start) ... 0x55 (End)
+        Uses the Numba-compiled parser when available.
         """
-        while len(self.buffer) > 0:
-            # Each frame must start with 0xAA
-            if self.buffer[0] != 0xAA:
-
-                self.buffer.pop(0)
-                continue
-            
-            if len(self.buffer) < 2:
-                break
-            
-            # 0x55 as second byte indicates a command/response frame (fixed 20 bytes)
-            if self.buffer[1] == 0x55:
-                if len(self.buffer) >= 20:
-                    self.buffer = self.buffer[20:]
-                else:
+        if not self._skip_to_start_byte():
+            return
+        if jit_parse is not None:
+            self._process_buffer_jit()
+        else:
+            self._process_buffer_py()
+
+    def _skip_to_start_byte(self) -> bool:
+        """
+        Drop leading garbage up to the next 0xAA start byte in a single C-level scan.
+        Returns False when nothing is left to parse.
+        """
+        buf = self.buffer
+        if buf and buf[0] != 0xAA:
+            idx = buf.find(0xAA)
+            if idx < 0:
+                buf.clear()
+            else:
+                del buf[:idx]
+        return bool(buf)
+
+    def _process_buffer_jit(self):
+        """Parse the whole buffer in one compiled pass, then build the CANFrame objects."""
+        buf = self.buffer
+        arr = np.frombuffer(buf, dtype=np.uint8)
+        ids, dlcs, starts, ext_flags, count, consumed = jit_parse(arr, len(arr))
+        del arr # Release the buffer export so the bytearray can be resized
+
+        if count:
+            timestamp = time.time()
+            frames = zip(ids[:count].tolist(), dlcs[:count].tolist(),
+                         starts[:count].tolist(), ext_flags[:count].tolist())
+            with memoryview(buf) as mv:
+                self.pending.extend(
+                    CANFrame(id=can_id, dlc=dlc, data=bytes(mv[start:start+dlc]),
+                             is_extended=is_ext, timestamp=timestamp)
+                    for can_id, dlc, start, is_ext in frames
+                )
+        del buf[:consumed]
+
+    def _process_buffer_py(self):
+        """Pure Python parser: scans the buffer with a cursor and compacts it once at the end."""
+        decoders = _data_frame_decoders()
+        timestamp = time.time()
+        buf = self.buffer
+        end = len(buf)
+        pos = 0
+        with memoryview(buf) as mv:
+            while pos < end:
+                # Each frame must start with 0xAA: resync on the next one
+                if mv[pos] != 0xAA:
+                    pos = buf.find(0xAA, pos + 1)
+                    if pos < 0:
+                        pos = end
+                    continue
+
+                if end - pos < 2:
                     break
-            # 0x0C (Standard) or 0x0E (Extended) in high nibble indicates a data frame
-            elif (self.buffer[1] >> 4) in (0x0C, 0x0E):
-                is_ext = bool(self.buffer[1] & 0x20)
-                dlc = self.buffer[1] & 0x0F
-                id_len = 4 if is_ext else 2
-                frame_len = dlc + id_len + 3 # 0xAA + CMD + ID + DATA[DLC] + 0x55
-                
-                if len(self.buffer) >= frame_len:
-                    frame_data = self.buffer[:frame_len]
-                    if frame_data[-1] == 0x55: # Verify end byte
-                        if is_ext:
-                            can_id = (frame_data[2] | (frame_data[3] << 8) | 
-                                     (frame_data[4] << 16) | (frame_data[5] << 24))
-                            data_start = 6
-                        else:
-                            can_id = frame_data[2] | (frame_data[3] << 8)
-                            data_start = 4
-                            
-                        frame = CANFrame(
-                            id=can_id,
-                            dlc=dlc,
-                            data=bytes(frame_data[data_start:data_start+dlc]),
-                            is_extended=is_ext,
-                            timestamp=time.time()
-                        )
-                        # Notify all observers
-                        for callback in self.on_frame_received:
-                            callback(frame)
-                    self.buffer = self.buffer[frame_len:]
+
+                cmd = mv[pos + 1]
+                # 0x55 as second byte indicates a command/response frame (fixed 20 bytes)
+                if cmd == 0x55:
+                    if end - pos >= 20:
+                        pos += 20
+                    else:
+                        break
+                elif decoders[cmd] is not None:
+                    frame_len, decode = decoders[cmd]
+                    if end - pos < frame_len:
+                        break
+
+                    frame = decode(mv, pos, timestamp)
+                    if frame is not None:
+                        # Queue for the consumer (drained periodically by the GUI)
+                        self.pending.append(frame)
+                    pos += frame_len
+
                 else:
-                    break
+                    # Discard invalid start byte and resync on the next 0xAA
+                    pos = buf.find(0xAA, pos + 1)
+                    if pos < 0:
+                        pos = end
 
-            else:
-                # Discard invalid start byte
-                self.buffer.pop(0)
+        # Drop everything consumed in a single resize
+        del buf[:pos]
@@ -0,0 +1,74 @@
+"""
+Numba-compiled batch parser for the USB-CAN serial byte stream.
+Numba is optional: when it is not installed, `parse` is None and the
+backend falls back to its pure Python parser.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+MIN_FRAME_LEN = 5 # 0xAA + CMD + STD ID (2) + 0x55 with no payload
+
+def _parse(buf, n):
+    """
+    Scan buf[:n] for data frames using the same framing as CANUSBBackend.
+    Returns (ids, dlcs, starts, ext_flags, count, consumed) where `starts`
+    holds the offset of each payload in buf and `consumed` is the number of
+    leading bytes that can be dropped from the buffer.
+    """
+    max_frames = n // MIN_FRAME_LEN + 1
+    ids = np.empty(max_frames, np.uint32)
+    dlcs = np.empty(max_frames, np.uint8)
+    starts = np.empty(max_frames, np.int64)
+    ext_flags = np.empty(max_frames, np.bool_)
+    count = 0
+    pos = 0
+    while pos < n:
+        # Each frame must start with 0xAA
+        if buf[pos] != 0xAA:
+            pos += 1
+            continue
+
+        if n - pos < 2:
+            break
+
+        cmd = buf[pos + 1]
+        # 0x55 as second byte indicates a command/response frame (fixed 20 bytes)
+        if cmd == 0x55:
+            if n - pos >= 20:
+                pos += 20
+            else:
+                break
+        # 0x0C (Standard) or 0x0E (Extended) in high nibble indicates a data frame
+        elif (cmd >> 4) == 0x0C or (cmd >> 4) == 0x0E:
+            is_ext = (cmd & 0x20) != 0
+            dlc = cmd & 0x0F
+            id_len = 4 if is_ext else 2
+            frame_len = dlc + id_len + 3 # 0xAA + CMD + ID + DATA[DLC] + 0x55
+
+            if n - pos < frame_len:
+                break
+
+            if buf[pos + frame_len - 1] == 0x55: # Verify end byte
+                can_id = np.uint32(buf[pos + 2]) | (np.uint32(buf[pos + 3]) << np.uint32(8))
+                if is_ext:
+                    can_id |= ((np.uint32(buf[pos + 4]) << np.uint32(16)) |
+                               (np.uint32(buf[pos + 5]) << np.uint32(24)))
+                ids[count] = can_id
+                dlcs[count] = dlc
+                starts[count] = pos + 2 + id_len
+                ext_flags[count] = is_ext
+                count += 1
+            pos += frame_len
+
+        else:
+            # Discard invalid start byte
+            pos += 1
+
+    return ids, dlcs, starts, ext_flags, count, pos
+
+# Compiled on first call (about a second), then loaded from the on-disk cache
+parse = njit(cache=True)(_parse) if njit is not None else None
@@ -0,0 +1,124 @@
+import random
+import unittest
+from canusb_backend import CANFrame
+from can_monitor_gui import CANFrameModel, Filter
+
+def make_frame(i, rng=None):
+    """Frame whose ID encodes its arrival order, with an optional random payload."""
+    if rng is None:
+        return CANFrame(id=i, dlc=1, data=bytes([i & 0xFF]), timestamp=1000.0 + i)
+    dlc = rng.randrange(9)
+    data = bytes(rng.choice((0x00, 0x01, 0x12, 0xAB, 0xFF)) for _ in range(dlc))
+    return CANFrame(id=rng.randrange(0x800), dlc=dlc, data=data,
+                    is_extended=rng.random() < 0.2, timestamp=1000.0 + i)
+
+class TestCANFrameModelRingBuffer(unittest.TestCase):
+    def assert_newest(self, model, frames, max_rows):
+        expected = frames[-max_rows:]
+        self.assertEqual(model.rowCount(), len(expected))
+        for row, frame in enumerate(expected):
+            self.assertEqual(model.frame(row), frame)
+            self.assertTrue(model.is_visible(row))
+        self.assertEqual(model.visible_rows().tolist(), list(range(len(expected))))
+
+    def test_wrapping_batches_keep_newest_frames_in_order(self):
+        max_rows = 7
+        model = CANFrameModel(max_rows=max_rows)
+        frames = [make_frame(i) for i in range(60)]
+
+        # Partial fill, partial overflow, writes crossing the array end, exact fit
+        pos = 0
+        for size in (3, 2, 4, 5, 1, 6, 7, 3):
+            batch = frames[pos:pos + size]
+            model.append_frames(batch)
+            pos += size
+            self.assert_newest(model, frames[:pos], max_rows)
+
+    def test_batch_larger_than_capacity(self):
+        max_rows = 5
+        model = CANFrameModel(max_rows=max_rows)
+        frames = [make_frame(i) for i in range(23)]
+        model.append_frames(frames[:3])
+        model.append_frames(frames[3:])
+        self.assert_newest(model, frames, max_rows)
+
+    def test_visibility_follows_wrapped_rows(self):
+        max_rows = 6
+        model = CANFrameModel(max_rows=max_rows)
+        model.set_filters([Filter("ID", "0x00a", "Exclude")])
+        frames = [make_frame(i) for i in range(15)]
+        for start in range(0, len(frames), 4):
+            model.append_frames(frames[start:start + 4])
+
+        kept = frames[-max_rows:]
+        self.assertEqual([model.frame(r).id for r in range(model.rowCount())], [f.id for f in kept])
+        expected = [row for row, f in enumerate(kept) if f.id != 0x00A]
+        self.assertEqual(model.visible_rows().tolist(), expected)
+        self.assertEqual([model.is_visible(r) for r in range(model.rowCount())],
+                         [f.id != 0x00A for f in kept])
+
+class TestCANFrameModelFilters(unittest.TestCase):
+    @staticmethod
+    def reference_visible(frame, filters):
+        """Filter semantics of the original table: OR of includes, then no exclude may match."""
+        id_text = f"0x{frame.id:03X}".lower()
+        data_text = " ".join(f"{b:02X}" for b in frame.data).lower()
+        def hit(f):
+            return f.value in (id_text if f.ftype == "ID" else data_text)
+        includes = [f for f in filters if f.logic == "Include"]
+        excludes = [f for f in filters if f.logic == "Exclude"]
+        if includes and not any(hit(f) for f in includes):
+            return False
+        return not any(hit(f) for f in excludes)
+
+    def setUp(self):
+        rng = random.Random(42)
+        # Wrapped ring so the bitmap is scattered back through non-trivial slots
+        self.model = CANFrameModel(max_rows=500)
+        self.frames = []
+        for start in range(0, 730, 90):
+            batch = [make_frame(i, rng) for i in range(start, min(start + 90, 730))]
+            self.frames.extend(batch)
+            self.model.append_frames(batch)
+        self.frames = self.frames[-500:]
+
+    def check(self, filters):
+        self.model.set_filters(filters)
+        bitmap = [self.model.is_visible(r) for r in range(self.model.rowCount())]
+        expected = [self.reference_visible(f, filters) for f in self.frames]
+        self.assertEqual(bitmap, expected)
+        self.assertEqual(self.model.visible_rows().tolist(),
+                         [r for r, v in enumerate(expected) if v])
+        return sum(expected)
+
+    def test_id_only_filters(self):
+        shown = self.check([Filter("ID", "1", "Include"), Filter("ID", "0x7", "Include")])
+        self.assertTrue(0 < shown < 500)
+        self.check([Filter("ID", "3", "Exclude")])
+
+    def test_data_only_filters(self):
+        shown = self.check([Filter("Data", "AB", "Include")])
+        self.assertTrue(0 < shown < 500)
+        self.check([Filter("Data", "00 01", "Exclude"), Filter("Data", "ff", "Exclude")])
+
+    def test_mixed_include_exclude(self):
+        shown = self.check([Filter("ID", "2", "Include"), Filter("Data", "12", "Include"),
+                            Filter("ID", "0x5", "Exclude"), Filter("Data", "ab ff", "Exclude")])
+        self.assertTrue(0 < shown < 500)
+
+    def test_empty_filters_reset_bitmap(self):
+        self.check([Filter("Data", "ab", "Include")])
+        self.assertEqual(self.check([]), 500)
+
+    def test_random_filter_sets(self):
+        rng = random.Random(7)
+        values = ["0", "1", "7f", "0x1", "00", "ab", "12 ab", "ff", " 0"]
+        for _ in range(50):
+            filters = [Filter(rng.choice(("ID", "Data")), rng.choice(values),
+                              rng.choice(("Include", "Exclude")))
+                       for _ in range(rng.randrange(1, 4))]
+            self.check(filters)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,15 @@
+import random
 import unittest
-from canusb_backend import CANUSBBackend, CANFrame
+import serial
+from canusb_backend import CANUSBBackend, CANFrame, _checksum8
+from canusb_parser import parse as jit_parse
 
 class MockSerial:
     def __init__(self):
         self.in_waiting = 0
         self.buffer = bytearray()
         self.written = []
+        self.closed = False
 
     def read(self, size):
         data = self.buffer[:size]
@@ -16,25 +20,30 @@ class MockSerial:
     def write(self, data):
         self.written.append(data)
 
+    def reset_input_buffer(self):
+        self.buffer = bytearray()
+        self.in_waiting = 0
+
     def close(self):
-        pass
+        self.closed = True
+
+class FailingWriteSerial(MockSerial):
+    def write(self, data):
+        raise serial.SerialTimeoutException("Write timeout")
 
 class TestCANUSBBackend(unittest.TestCase):
     def test_parse_data_frame(self):
         backend = CANUSBBackend("MOCK")
         backend.running = True
         
-        frames_received = []
-        backend.add_callback(lambda f: frames_received.append(f))
-        
         # Standard data frame: 0xaa, 0xc8 (DLC 8, STD, Data), ID 0x123 (LSB 0x23, MSB 0x01), 8 bytes data, 0x55
         test_data = bytes([0xAA, 0xC8, 0x23, 0x01, 1, 2, 3, 4, 5, 6, 7, 8, 0x55])
         backend.buffer.extend(test_data)
         
         backend._process_buffer()
         
-        self.assertEqual(len(frames_received), 1)
-        frame = frames_received[0]
+        self.assertEqual(len(backend.pending), 1)
+        frame = backend.pending.popleft()
         self.assertEqual(frame.id, 0x123)
         self.assertEqual(frame.dlc, 8)
         self.assertEqual(frame.data, bytes([1, 2, 3, 4, 5, 6, 7, 8]))
@@ -45,9 +54,6 @@ class TestCANUSBBackend(unittest.TestCase):
         backend = CANUSBBackend("MOCK")
         backend.running = True
         
-        frames_received = []
-        backend.add_callback(lambda f: frames_received.append(f))
-        
         # Extended data frame (from user): aa e5 50 00 00 00 ff aa 69 88 b5 55
         # dlc=5, ID=0x50, is_extended=True
         test_data = bytes([0xAA, 0xE5, 0x50, 0x00, 0x00, 0x00, 0xFF, 0xAA, 0x69, 0x88, 0xB5, 0x55])
@@ -55,13 +61,132 @@ class TestCANUSBBackend(unittest.TestCase):
         
         backend._process_buffer()
         
-        self.assertEqual(len(frames_received), 1)
-        frame = frames_received[0]
+        self.assertEqual(len(backend.pending), 1)
+        frame = backend.pending.popleft()
         self.assertEqual(frame.id, 0x50)
         self.assertEqual(frame.dlc, 5)
         self.assertEqual(frame.data, bytes([0xFF, 0xAA, 0x69, 0x88, 0xB5]))
         self.assertTrue(frame.is_extended)
 
+    def test_parse_stream_with_garbage_and_partial_frame(self):
+        backend = CANUSBBackend("MOCK")
+        backend.running = True
+
+        # Garbage, a 20-byte command response, two data frames and a truncated one
+        response = bytes([0xAA, 0x55]) + bytes(18)
+        frame_a = bytes([0xAA, 0xC2, 0x34, 0x02, 0x11, 0x22, 0x55])
+        frame_b = bytes([0xAA, 0xC0, 0x7F, 0x00, 0x55])
+        partial = bytes([0xAA, 0xC8, 0x01, 0x00, 1, 2])
+        backend.buffer.extend(b"\x00\x13" + response + b"\xFF" + frame_a + frame_b + partial)
+
+        backend._process_buffer()
+
+        frames = list(backend.pending)
+        self.assertEqual([f.id for f in frames], [0x234, 0x7F])
+        self.assertEqual(frames[0].data, bytes([0x11, 0x22]))
+        self.assertEqual(frames[1].data, b"")
+        # Incomplete trailing frame is kept for the next read
+        self.assertEqual(bytes(backend.buffer), partial)
+
+    def test_read_loop_iteration_drains_serial(self):
+        backend = CANUSBBackend("MOCK")
+        backend.ser = MockSerial()
+
+        # Nothing received before the read timeout
+        backend._read_loop_iteration()
+        self.assertEqual(len(backend.pending), 0)
+
+        backend.ser.buffer.extend(bytes([0xAA, 0xC1, 0x23, 0x01, 0x42, 0x55]))
+        backend.ser.in_waiting = len(backend.ser.buffer)
+        backend._read_loop_iteration()
+
+        self.assertEqual(len(backend.pending), 1)
+        self.assertEqual(backend.pending[0].id, 0x123)
+        self.assertEqual(backend.ser.in_waiting, 0)
+
+    def test_read_loop_configures_adapter_first(self):
+        backend = CANUSBBackend("MOCK")
+        backend.ser = MockSerial()
+        backend.ser.buffer.extend(b"\x13\x37") # Stale bytes from before configuration
+        backend.running = False # Return right after the adapter setup
+
+        backend._read_loop()
+
+        self.assertEqual(len(backend.ser.written), 1)
+        self.assertEqual(backend.ser.written[0][:3], bytearray([0xAA, 0x55, 0x12]))
+        self.assertEqual(len(backend.ser.buffer), 0)
+
+    def test_read_loop_reports_init_failure(self):
+        backend = CANUSBBackend("MOCK")
+        backend.ser = FailingWriteSerial()
+        backend.running = True
+
+        backend._read_loop()
+
+        self.assertFalse(backend.running)
+        self.assertIsInstance(backend.error, serial.SerialTimeoutException)
+        self.assertTrue(backend.ser.closed)
+
+    def test_init_command_checksum(self):
+        backend = CANUSBBackend("MOCK", can_speed=250000)
+        backend.ser = MockSerial()
+        backend._init_adapter()
+
+        cmd = backend.ser.written[0]
+        self.assertEqual(len(cmd), 20)
+        self.assertEqual(cmd[3], 0x05)
+        self.assertEqual(cmd[-1], (0x12 + 0x05 + 0x01 + 0x01) & 0xFF)
+
+        # Large buffers take the numpy path and must agree with sum()
+        big = bytes(range(256)) * 8 + b"\x07"
+        self.assertEqual(_checksum8(big), sum(big) & 0xFF)
+        self.assertEqual(_checksum8(bytearray(big)), sum(big) & 0xFF)
+
+    def test_resync_over_long_garbage_run(self):
+        backend = CANUSBBackend("MOCK")
+
+        # No start byte at all: everything is discarded
+        backend.buffer.extend(bytes(range(0x100)).replace(b"\xAA", b"") * 64)
+        backend._process_buffer()
+        self.assertEqual(len(backend.buffer), 0)
+
+        # Garbage followed by a valid frame
+        frame = bytes([0xAA, 0xC1, 0x10, 0x00, 0x99, 0x55])
+        backend.buffer.extend(b"\x01" * 4096 + frame)
+        backend._process_buffer()
+        self.assertEqual(len(backend.buffer), 0)
+        self.assertEqual([f.id for f in backend.pending], [0x10])
+
+    @unittest.skipIf(jit_parse is None, "numba not installed")
+    def test_jit_parser_matches_python_parser(self):
+        rng = random.Random(1234)
+        stream = bytearray()
+        for _ in range(500):
+            kind = rng.random()
+            if kind < 0.1:
+                stream += bytes(rng.randrange(256) for _ in range(rng.randrange(1, 6)))
+            elif kind < 0.2:
+                stream += bytes([0xAA, 0x55]) + bytes(18)
+            else:
+                is_ext = rng.random() < 0.5
+                dlc = rng.randrange(9)
+                id_len = 4 if is_ext else 2
+                stream += bytes([0xAA, (0xE0 if is_ext else 0xC0) | dlc])
+                stream += bytes(rng.randrange(256) for _ in range(id_len + dlc))
+                stream += b"\x55"
+        stream += bytes([0xAA, 0xC8, 0x01])
+
+        results = []
+        for process in ("_process_buffer_jit", "_process_buffer_py"):
+            backend = CANUSBBackend("MOCK")
+            backend.buffer.extend(stream)
+            getattr(backend, process)()
+            frames = [(f.id, f.dlc, f.data, f.is_extended) for f in backend.pending]
+            results.append((frames, bytes(backend.buffer)))
+
+        self.assertGreater(len(results[0][0]), 300)
+        self.assertEqual(results[0], results[1])
+
 
 if __name__ == "__main__":
     unittest.main()